@@ -1,5 +1,7 @@
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from typing import Optional, List
+from typing import Optional, List, Literal
+from functools import cached_property, lru_cache
 import os
 
 
@@ -13,11 +15,19 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     env: str = "production"
     log_level: str = "info"
+    workers: int = 1
+    
+    # News backend ("serpapi" or "newdata")
+    news_backend: Literal["serpapi", "newdata"] = "serpapi"
     
     # SerpAPI Configuration
     serpapi_api_key: str = "742a92b18e3dc1a4f2205c40ec85633e8f0b1dc77caefe43a2be328036666633"
     serpapi_api_url: str = "https://serpapi.com/search.json"
     
+    # Newdata.io Configuration
+    newdata_api_key: str = ""
+    newdata_api_url: str = "https://newsdata.io/api/1"
+    
     # CORS Configuration
     allowed_origins: str = "*"
     
@@ -25,12 +35,18 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = False
         
-    @property
+    @field_validator("news_backend", mode="before")
+    @classmethod
+    def normalize_news_backend(cls, value: str) -> str:
+        """Accept backend names case-insensitively."""
+        return value.strip().lower() if isinstance(value, str) else value
+    
+    @cached_property
     def cors_origins(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
-        if self.allowed_origins == "*":
+        """Parse CORS origins from comma-separated string (computed once)."""
+        if self.allowed_origins.strip() == "*":
             return ["*"]
-        return [origin.strip() for origin in self.allowed_origins.split(",")]
+        return [origin.strip() for origin in self.allowed_origins.split(",") if origin.strip()]
     
     def validate_config(self) -> bool:
         """Validate required configuration."""
@@ -38,5 +54,11 @@ class Settings(BaseSettings):
         return True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the cached application settings instance."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -1,13 +1,17 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from datetime import datetime
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
+import asyncio
 import logging
+import httpx
 
 from app.config import settings
+from app.utils import utcnow_iso
 from app.routes.news import router as news_router
-from app.services.serpapi_service import serpapi_service
-from app.models import ServiceInfoResponse, HealthResponse
+from app.services import get_news_service, get_service
+from app.services.base_service import BaseHttpService
+from app.models import ServiceInfoResponse, HealthResponse, DeepHealthResponse
 
 # Configure logging
 logging.basicConfig(
@@ -16,13 +20,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run validation and setup on startup, cleanup on shutdown."""
+    logger.info("=" * 50)
+    logger.info(f"{settings.app_name} starting up...")
+    logger.info(f"Environment: {settings.env}")
+    logger.info(f"Version: {settings.app_version}")
+    logger.info(f"News backend: {settings.news_backend}")
+    
+    # Validate configuration
+    settings.validate_config()
+    
+    news_service = get_news_service()
+    
+    # Shared HTTP client so upstream calls reuse pooled keep-alive connections;
+    # default headers are set here once rather than per request
+    client = httpx.AsyncClient(
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        headers={"Content-Type": "application/json"}
+    )
+    app.state.http_client = client
+    BaseHttpService._client = client
+    
+    try:
+        # Warm up DNS and the TLS session so the first request does not pay for it
+        try:
+            await client.head(news_service.api_url, timeout=5.0)
+        except httpx.HTTPError as e:
+            logger.warning(f"Connection warmup failed: {e}")
+        
+        logger.info("Application started successfully")
+        logger.info("=" * 50)
+        
+        yield
+    finally:
+        logger.info("Application shutting down...")
+        await client.aclose()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Standalone news agent with SerpAPI integration for BTP deployment",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -34,34 +82,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Validate configuration on startup
-@app.on_event("startup")
-async def startup_event():
-    """Run validation and setup on application startup."""
-    logger.info("=" * 50)
-    logger.info(f"{settings.app_name} starting up...")
-    logger.info(f"Environment: {settings.env}")
-    logger.info(f"Version: {settings.app_version}")
-    
-    # Validate configuration
-    settings.validate_config()
-    
-    logger.info("Application started successfully")
-    logger.info("=" * 50)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on application shutdown."""
-    logger.info("Application shutting down...")
-
 
 # Exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unhandled errors."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    if settings.env == "development":
+        logger.exception("Unhandled exception")
+    else:
+        # Skip traceback formatting in production; it is costly during error bursts
+        logger.error("Unhandled exception: %s: %s", type(exc).__name__, exc)
+        logger.debug("Unhandled exception traceback", exc_info=exc)
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -69,7 +101,7 @@ async def global_exception_handler(request: Request, exc: Exception):
                 "message": "Internal server error",
                 "details": str(exc) if settings.env == "development" else "An error occurred"
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utcnow_iso()
         }
     )
 
@@ -86,6 +118,7 @@ async def root():
         description="Standalone news agent with SerpAPI integration",
         endpoints={
             "health": "/health",
+            "health_deep": "/health/deep",
             "docs": "/docs",
             "news": "/api/news",
             "headlines": "/api/headlines",
@@ -101,15 +134,53 @@ async def root():
 async def health_check():
     """
     Health check endpoint to verify service status.
+    Does not call any upstream API, so it is safe for frequent probes.
     """
-    serpapi_health = await serpapi_service.health_check()
+    service_health = await get_news_service().health_check()
     
     return HealthResponse(
         status="ok",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=utcnow_iso(),
+        service=settings.app_name,
+        environment=settings.env,
+        newdata_service=service_health
+    )
+
+
+# Deep health check endpoint
+@app.get("/health/deep", response_model=DeepHealthResponse)
+async def deep_health_check():
+    """
+    Health check endpoint that also verifies upstream API connectivity.
+    Only the configured backend is probed, so unused backends are neither
+    created nor billed; probes run concurrently via asyncio.gather.
+    """
+    probed = (settings.news_backend,)
+    results = await asyncio.gather(
+        *(get_service(backend).deep_health_check() for backend in probed),
+        return_exceptions=True
+    )
+    
+    backends = {}
+    for backend, result in zip(probed, results):
+        if isinstance(result, Exception):
+            result = {
+                "success": False,
+                "status": "unhealthy",
+                "error": str(result),
+                "timestamp": utcnow_iso()
+            }
+        backends[backend] = result
+    
+    service_health = backends[settings.news_backend]
+    
+    return DeepHealthResponse(
+        status="ok" if service_health.get("success") else "degraded",
+        timestamp=utcnow_iso(),
         service=settings.app_name,
         environment=settings.env,
-        newdata_service=serpapi_health
+        newdata_service=service_health,
+        backends=backends
     )
 
 
@@ -121,7 +192,7 @@ app.include_router(news_router)
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc):
     """Handle 404 errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "success": False,
@@ -129,6 +200,6 @@ async def not_found_handler(request: Request, exc):
                 "message": "Route not found",
                 "path": str(request.url)
             },
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utcnow_iso()
         }
     )
\ No newline at end of file
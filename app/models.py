@@ -1,10 +1,12 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Any, Dict, List
-from datetime import datetime
+from app.utils import utcnow_iso
 
 
 class NewsQueryParams(BaseModel):
     """Query parameters for news fetching."""
+    model_config = ConfigDict(extra='ignore', frozen=True, populate_by_name=True)
+    
     query: Optional[str] = Field(None, description="Search query term")
     category: Optional[str] = Field(None, description="News category (e.g., business, technology, sports)")
     country: Optional[str] = Field(None, description="Country code (e.g., us, uk, in)")
@@ -14,6 +16,8 @@ class NewsQueryParams(BaseModel):
 
 class HeadlineParams(BaseModel):
     """Query parameters for headlines fetching."""
+    model_config = ConfigDict(extra='ignore', frozen=True, populate_by_name=True)
+    
     category: Optional[str] = Field(None, description="News category")
     country: Optional[str] = Field("us", description="Country code")
     limit: int = Field(10, ge=1, le=100, description="Number of results to return")
@@ -21,6 +25,8 @@ class HeadlineParams(BaseModel):
 
 class SearchParams(BaseModel):
     """Query parameters for topic search."""
+    model_config = ConfigDict(extra='ignore', frozen=True, populate_by_name=True)
+    
     country: Optional[str] = Field(None, description="Country code")
     language: Optional[str] = Field("en", description="Language code")
     limit: int = Field(10, ge=1, le=100, description="Number of results to return")
@@ -28,14 +34,18 @@ class SearchParams(BaseModel):
 
 class NewsResponse(BaseModel):
     """Standard response model for news data."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     success: bool
     data: Optional[Dict[str, Any]] = None
     error: Optional[Dict[str, Any]] = None
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=utcnow_iso)
 
 
 class HealthResponse(BaseModel):
     """Health check response model."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     status: str
     timestamp: str
     service: str
@@ -43,8 +53,15 @@ class HealthResponse(BaseModel):
     newdata_service: Dict[str, Any]
 
 
+class DeepHealthResponse(HealthResponse):
+    """Deep health check response model including per-backend status."""
+    backends: Dict[str, Dict[str, Any]]
+
+
 class ServiceInfoResponse(BaseModel):
     """Service information response model."""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     service: str
     version: str
     description: str
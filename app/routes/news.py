@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from app.models import NewsQueryParams, NewsResponse
-from app.services.serpapi_service import serpapi_service
+from app.services import get_news_service
 
 router = APIRouter(prefix="/api", tags=["news"])
 
@@ -31,12 +32,13 @@ async def get_news(
         "limit": limit
     }
     
-    result = await serpapi_service.fetch_news(params)
+    result = await get_news_service().fetch_news(params)
     
     if not result.get("success"):
-        raise HTTPException(status_code=500, detail=result.get("error"))
+        raise HTTPException(status_code=result.get("status_code", 500), detail=result.get("error"))
     
-    return result
+    # Return directly; response_model is kept for the API docs only
+    return ORJSONResponse(result)
 
 
 @router.get("/headlines", response_model=NewsResponse)
@@ -58,12 +60,12 @@ async def get_headlines(
         "limit": limit
     }
     
-    result = await serpapi_service.fetch_headlines(params)
+    result = await get_news_service().fetch_headlines(params)
     
     if not result.get("success"):
-        raise HTTPException(status_code=500, detail=result.get("error"))
+        raise HTTPException(status_code=result.get("status_code", 500), detail=result.get("error"))
     
-    return result
+    return ORJSONResponse(result)
 
 
 @router.get("/search/{topic}", response_model=NewsResponse)
@@ -87,12 +89,12 @@ async def search_by_topic(
         "limit": limit
     }
     
-    result = await serpapi_service.search_by_topic(topic, options)
+    result = await get_news_service().search_by_topic(topic, options)
     
     if not result.get("success"):
-        raise HTTPException(status_code=500, detail=result.get("error"))
+        raise HTTPException(status_code=result.get("status_code", 500), detail=result.get("error"))
     
-    return result
+    return ORJSONResponse(result)
 
 
 @router.post("/news/query", response_model=NewsResponse)
@@ -109,9 +111,9 @@ async def query_news(params: NewsQueryParams):
     """
     params_dict = params.model_dump()
     
-    result = await serpapi_service.fetch_news(params_dict)
+    result = await get_news_service().fetch_news(params_dict)
     
     if not result.get("success"):
-        raise HTTPException(status_code=500, detail=result.get("error"))
+        raise HTTPException(status_code=result.get("status_code", 500), detail=result.get("error"))
     
-    return result
\ No newline at end of file
+    return ORJSONResponse(result)
\ No newline at end of file
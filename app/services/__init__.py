@@ -1 +1,29 @@
-# Services module
\ No newline at end of file
+# Services module
+from functools import lru_cache
+from app.config import settings
+from app.services.base_service import BaseHttpService
+
+
+@lru_cache(maxsize=None)
+def get_service(backend: str) -> BaseHttpService:
+    """
+    Return the service instance for a backend, creating it on first use.
+    
+    Args:
+        backend: Backend name, either "serpapi" or "newdata"
+        
+    Returns:
+        Service instance for the backend
+    """
+    if backend == "serpapi":
+        from app.services.serpapi_service import SerpAPIService
+        return SerpAPIService()
+    if backend == "newdata":
+        from app.services.newdata_service import NewdataService
+        return NewdataService()
+    raise ValueError(f"Unknown news backend: {backend}")
+
+
+def get_news_service() -> BaseHttpService:
+    """Return the service for the configured news backend."""
+    return get_service(settings.news_backend)
@@ -0,0 +1,163 @@
+import httpx
+import orjson
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, Callable
+from app.utils import utcnow_iso
+
+
+class BaseHttpService(ABC):
+    """Shared request and error handling for upstream news API services."""
+    
+    # Error messages, overridden by each service
+    no_response_message = "No response from upstream API"
+    failure_message = "Failed to fetch data"
+    
+    # Shared connection-pooled client, assigned on application startup
+    _client: Optional[httpx.AsyncClient] = None
+    
+    def __init__(self, api_url: str, api_key: str):
+        self.api_url = api_url
+        self.api_key = api_key
+        # Constant error payload for requests that received no response
+        self._request_error = {
+            "success": False,
+            "error": {
+                "message": self.no_response_message,
+                "details": "The request was made but no response was received"
+            }
+        }
+    
+    async def _request(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        transform: Optional[Callable[[Any], Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Perform a GET request against the upstream API.
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters
+            transform: Optional function building the response data from the decoded JSON
+            
+        Returns:
+            Dictionary containing success status and data or error
+        """
+        try:
+            response = await self._client.get(url, params=params)
+            response.raise_for_status()
+            
+            data = orjson.loads(response.content)
+            
+            return {
+                "success": True,
+                "data": transform(data) if transform else data,
+                "timestamp": utcnow_iso()
+            }
+            
+        except httpx.HTTPStatusError as e:
+            return self._handle_error(e, "HTTP error")
+        except httpx.RequestError as e:
+            return self._handle_error(e, "Request error")
+        except Exception as e:
+            return self._handle_error(e, "Unexpected error")
+    
+    @abstractmethod
+    async def fetch_news(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch news articles; implemented by each service."""
+    
+    @abstractmethod
+    async def fetch_headlines(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch top headlines; implemented by each service."""
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Report local liveness of the service without any network I/O.
+        
+        Returns:
+            Dictionary containing health status
+        """
+        return self._health_status()
+    
+    @abstractmethod
+    async def deep_health_check(self) -> Dict[str, Any]:
+        """Check health of the service including upstream connectivity; implemented by each service."""
+    
+    async def search_by_topic(self, topic: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Search news by topic.
+        
+        Args:
+            topic: Topic to search for
+            options: Additional query options
+            
+        Returns:
+            Dictionary containing success status and data or error
+        """
+        try:
+            params = {
+                "query": topic,
+                **options
+            }
+            return await self.fetch_news(params)
+            
+        except Exception as e:
+            return self._handle_error(e, "Search error")
+    
+    def _health_status(self, error: Optional[Any] = None) -> Dict[str, Any]:
+        """
+        Build a health status dictionary.
+        
+        Args:
+            error: Error description, if the service is unhealthy
+            
+        Returns:
+            Dictionary containing health status
+        """
+        if error is None:
+            return {
+                "success": True,
+                "status": "healthy",
+                "timestamp": utcnow_iso()
+            }
+        return {
+            "success": False,
+            "status": "unhealthy",
+            "error": error,
+            "timestamp": utcnow_iso()
+        }
+    
+    def _handle_error(self, error: Exception, error_type: str) -> Dict[str, Any]:
+        """
+        Handle and format errors.
+        
+        Args:
+            error: Exception that occurred
+            error_type: Type of error
+            
+        Returns:
+            Dictionary containing error information
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            return {
+                "success": False,
+                "error": {
+                    "message": f"API request failed: {error_type}",
+                    "status": error.response.status_code,
+                    "details": str(error)
+                },
+                "timestamp": utcnow_iso()
+            }
+        elif isinstance(error, httpx.RequestError):
+            # Shares the prebuilt error payload; callers must not mutate it
+            return {**self._request_error, "timestamp": utcnow_iso()}
+        else:
+            return {
+                "success": False,
+                "error": {
+                    "message": f"{self.failure_message}: {error_type}",
+                    "details": str(error)
+                },
+                "timestamp": utcnow_iso()
+            }
@@ -1,23 +1,34 @@
-import httpx
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any
 from app.config import settings
+from app.services.base_service import BaseHttpService
 
 
-class NewdataService:
+# (upstream parameter, request key, default) for each optional query parameter
+NEWS_PARAM_KEYS = (
+    ("q", "query", None),
+    ("category", "category", None),
+    ("country", "country", None),
+    ("language", "language", "en"),
+)
+HEADLINE_PARAM_KEYS = (
+    ("category", "category", None),
+    ("country", "country", "us"),
+)
+
+
+class NewdataService(BaseHttpService):
     """Service for interacting with newdata.io API."""
     
+    no_response_message = "No response from newdata.io API"
+    failure_message = "Failed to fetch news data"
+    
     def __init__(self):
-        self.api_url = settings.newdata_api_url
-        self.api_key = settings.newdata_api_key
-        self.timeout = 30.0
+        super().__init__(settings.newdata_api_url, settings.newdata_api_key)
+        # Precomputed endpoint URLs
+        self._news_url = f"{self.api_url}/news"
+        self._headlines_url = f"{self.api_url}/latest"
+        self._health_url = f"{self.api_url}/health"
         
-    def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers for API requests."""
-        return {
-            "Content-Type": "application/json"
-        }
-    
     async def fetch_news(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Fetch news articles from newdata.io.
@@ -28,38 +39,15 @@ class NewdataService:
         Returns:
             Dictionary containing success status and data or error
         """
-        try:
-            query_params = {
-                "apikey": self.api_key,
-                "q": params.get("query", ""),
-                "category": params.get("category", ""),
-                "country": params.get("country", ""),
-                "language": params.get("language", "en")
-            }
-            
-            # Remove empty parameters except apikey
-            query_params = {k: v for k, v in query_params.items() if v or k == "apikey"}
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.api_url}/news",
-                    params=query_params,
-                    headers=self._get_headers()
-                )
-                response.raise_for_status()
-                
-                return {
-                    "success": True,
-                    "data": response.json(),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except httpx.HTTPStatusError as e:
-            return self._handle_error(e, "HTTP error")
-        except httpx.RequestError as e:
-            return self._handle_error(e, "Request error")
-        except Exception as e:
-            return self._handle_error(e, "Unexpected error")
+        # Only include non-empty parameters
+        query_params = {
+            name: value
+            for name, key, default in NEWS_PARAM_KEYS
+            if (value := params.get(key, default))
+        }
+        query_params["apikey"] = self.api_key
+        
+        return await self._request(self._news_url, query_params)
     
     async def fetch_headlines(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -71,121 +59,26 @@ class NewdataService:
         Returns:
             Dictionary containing success status and data or error
         """
-        try:
-            query_params = {
-                "apikey": self.api_key,
-                "category": params.get("category", ""),
-                "country": params.get("country", "us")
-            }
-            
-            # Remove empty parameters except apikey
-            query_params = {k: v for k, v in query_params.items() if v or k == "apikey"}
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.api_url}/latest",
-                    params=query_params,
-                    headers=self._get_headers()
-                )
-                response.raise_for_status()
-                
-                return {
-                    "success": True,
-                    "data": response.json(),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except httpx.HTTPStatusError as e:
-            return self._handle_error(e, "HTTP error")
-        except httpx.RequestError as e:
-            return self._handle_error(e, "Request error")
-        except Exception as e:
-            return self._handle_error(e, "Unexpected error")
-    
-    async def search_by_topic(self, topic: str, options: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Search news by topic.
+        # Only include non-empty parameters
+        query_params = {
+            name: value
+            for name, key, default in HEADLINE_PARAM_KEYS
+            if (value := params.get(key, default))
+        }
+        query_params["apikey"] = self.api_key
         
-        Args:
-            topic: Topic to search for
-            options: Additional query options
-            
-        Returns:
-            Dictionary containing success status and data or error
-        """
-        try:
-            params = {
-                "query": topic,
-                **options
-            }
-            return await self.fetch_news(params)
-            
-        except Exception as e:
-            return self._handle_error(e, "Search error")
+        return await self._request(self._headlines_url, query_params)
     
-    async def health_check(self) -> Dict[str, Any]:
+    async def deep_health_check(self) -> Dict[str, Any]:
         """
-        Check health of newdata.io service.
+        Check health of newdata.io service by calling its health endpoint.
         
         Returns:
             Dictionary containing health status
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(
-                    f"{self.api_url}/health",
-                    headers=self._get_headers()
-                )
-                return {
-                    "success": True,
-                    "status": "healthy",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+            response = await self._client.get(self._health_url, timeout=5.0)
+            response.raise_for_status()
+            return self._health_status()
         except Exception as e:
-            return {
-                "success": False,
-                "status": "unhealthy",
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-    
-    def _handle_error(self, error: Exception, error_type: str) -> Dict[str, Any]:
-        """
-        Handle and format errors.
-        
-        Args:
-            error: Exception that occurred
-            error_type: Type of error
-            
-        Returns:
-            Dictionary containing error information
-        """
-        if isinstance(error, httpx.HTTPStatusError):
-            return {
-                "success": False,
-                "error": {
-                    "message": f"API request failed: {error_type}",
-                    "status": error.response.status_code,
-                    "details": str(error)
-                }
-            }
-        elif isinstance(error, httpx.RequestError):
-            return {
-                "success": False,
-                "error": {
-                    "message": "No response from newdata.io API",
-                    "details": "The request was made but no response was received"
-                }
-            }
-        else:
-            return {
-                "success": False,
-                "error": {
-                    "message": f"Failed to fetch news data: {error_type}",
-                    "details": str(error)
-                }
-            }
-
-
-# Global service instance
-newdata_service = NewdataService()
\ No newline at end of file
+            return self._health_status(str(e))
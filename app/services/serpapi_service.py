@@ -1,23 +1,33 @@
-import httpx
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple
 from app.config import settings
+from app.services.base_service import BaseHttpService
+from app.utils import utcnow_iso
 
 
-class SerpAPIService:
+# In-process cache settings for SerpAPI responses
+SEARCH_CACHE_TTL = 60.0
+SEARCH_CACHE_MAX_SIZE = 512
+HEALTH_CACHE_TTL = 10.0
+
+
+class SerpAPIService(BaseHttpService):
     """Service for interacting with SerpAPI."""
     
+    no_response_message = "No response from SerpAPI"
+    failure_message = "Failed to fetch data"
+    
     def __init__(self):
-        self.api_url = settings.serpapi_api_url
-        self.api_key = settings.serpapi_api_key
-        self.timeout = 30.0
+        super().__init__(settings.serpapi_api_url, settings.serpapi_api_key)
+        # LRU of (normalized query, limit) -> (monotonic timestamp, result)
+        self._cache: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Searches currently in flight, shared by concurrent identical requests
+        self._inflight: Dict[Tuple[str, int], "asyncio.Task[Dict[str, Any]]"] = {}
         
-    def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers for API requests."""
-        return {
-            "Content-Type": "application/json"
-        }
-    
     def _combine_results(self, results: List[Dict[str, Any]]) -> str:
         """
         Combine questions and snippets from search results into a comprehensive response.
@@ -38,27 +48,27 @@ class SerpAPIService:
             snippet = result.get('snippet', '')
             
             if question or snippet:
-                section = f"**Result {idx}:**\n"
+                lines = [f"**Result {idx}:**\n"]
                 if question:
-                    section += f"Question: {question}\n"
+                    lines.append(f"Question: {question}\n")
                 if snippet:
-                    section += f"Answer: {snippet}\n"
-                combined_text.append(section)
+                    lines.append(f"Answer: {snippet}\n")
+                combined_text.append("".join(lines))
         
         if not combined_text:
             return "No relevant information found in the search results."
         
-        # Join all sections with a separator
-        comprehensive_response = "\n---\n\n".join(combined_text)
-        
-        # Add a summary header
-        summary = f"**Comprehensive Search Results ({len(results)} results found)**\n\n"
-        
-        return summary + comprehensive_response
+        # Summary header followed by all sections joined with a separator
+        return "".join((
+            f"**Comprehensive Search Results ({len(results)} results found)**\n\n",
+            "\n---\n\n".join(combined_text)
+        ))
     
     async def search(self, query: str, limit: int = 5) -> Dict[str, Any]:
         """
         Search using SerpAPI and return combined results.
+        Successful responses are cached for SEARCH_CACHE_TTL seconds, and
+        concurrent identical searches share a single upstream request.
         
         Args:
             query: Search query string
@@ -67,67 +77,140 @@ class SerpAPIService:
         Returns:
             Dictionary containing success status and comprehensive response
         """
-        try:
-            query_params = {
-                "q": query,
-                "api_key": self.api_key,
-                "num": limit  # SerpAPI uses 'num' parameter for result count
-            }
+        key = (query.strip().lower(), limit)
+        cached = self._cache.get(key)
+        if cached is not None:
+            cached_at, cached_result = cached
+            if time.monotonic() - cached_at < SEARCH_CACHE_TTL:
+                self._cache.move_to_end(key)
+                return self._copy_result(cached_result, query)
+            del self._cache[key]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            # Run the upstream call in its own task so cancelling one caller
+            # does not cancel it for the others
+            task = asyncio.create_task(self._search_and_cache(key, query, limit))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release_inflight(key, done))
+        
+        return self._copy_result(await asyncio.shield(task), query)
+    
+    async def _search_and_cache(self, key: Tuple[str, int], query: str, limit: int) -> Dict[str, Any]:
+        """
+        Perform an uncached search and cache the result if successful.
+        
+        Args:
+            key: Cache key for the search
+            query: Search query string
+            limit: Number of results to return
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.api_url,
-                    params=query_params,
-                    headers=self._get_headers()
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Extract results (SerpAPI may return results in different formats)
-                # Check for 'organic_results', 'related_questions', or direct results
-                results = []
-                
-                # Try to get related_questions which often have question/snippet format
-                if 'related_questions' in data:
-                    results = data['related_questions'][:limit]
-                # Try organic_results as fallback
-                elif 'organic_results' in data:
-                    organic = data['organic_results'][:limit]
-                    # Transform organic results to question/snippet format
-                    results = [
-                        {
-                            'question': item.get('title', ''),
-                            'snippet': item.get('snippet', '')
-                        }
-                        for item in organic
-                    ]
-                # Use the raw data if it already has the expected format
-                else:
-                    # Assume the data might be in the format you described
-                    results = data if isinstance(data, list) else []
-                
-                # Generate comprehensive response
-                comprehensive_response = self._combine_results(results)
-                
-                return {
-                    "success": True,
-                    "data": {
-                        "query": query,
-                        "results_count": len(results),
-                        "comprehensive_response": comprehensive_response,
-                        "raw_results": results,
-                        "full_data": data  # Include full API response for debugging
-                    },
-                    "timestamp": datetime.utcnow().isoformat()
+        Returns:
+            Dictionary containing success status and comprehensive response
+        """
+        result = await self._search(query, limit)
+        
+        if result.get("success"):
+            self._cache[key] = (time.monotonic(), result)
+            if len(self._cache) > SEARCH_CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+        
+        return result
+    
+    def _release_inflight(self, key: Tuple[str, int], task: "asyncio.Task[Dict[str, Any]]") -> None:
+        """Forget a finished in-flight search."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+    
+    def _copy_result(self, result: Dict[str, Any], query: str) -> Dict[str, Any]:
+        """
+        Copy a shared search result for one caller.
+        
+        Args:
+            result: Result stored in the cache or shared by an in-flight search
+            query: Query string as given by this caller
+            
+        Returns:
+            Deep copy of the result reporting the caller's query and the current time
+        """
+        result = copy.deepcopy(result)
+        if result.get("success"):
+            result["data"]["query"] = query
+        result["timestamp"] = utcnow_iso()
+        return result
+    
+    async def _search(self, query: str, limit: int) -> Dict[str, Any]:
+        """
+        Perform an uncached SerpAPI search.
+        
+        Args:
+            query: Search query string
+            limit: Number of results to return
+            
+        Returns:
+            Dictionary containing success status and comprehensive response
+        """
+        query_params = {
+            "q": query,
+            "api_key": self.api_key,
+            "num": limit  # SerpAPI uses 'num' parameter for result count
+        }
+        
+        return await self._request(
+            self.api_url,
+            query_params,
+            lambda data: self._build_search_data(query, limit, data)
+        )
+    
+    def _build_search_data(self, query: str, limit: int, data: Any) -> Dict[str, Any]:
+        """
+        Extract results from a SerpAPI response and build the response data.
+        
+        Args:
+            query: Search query string
+            limit: Number of results to return
+            data: Decoded SerpAPI response
+            
+        Returns:
+            Dictionary containing the comprehensive response and results
+        """
+        # Extract results (SerpAPI may return results in different formats)
+        # Check for 'organic_results', 'related_questions', or direct results
+        results = []
+        
+        # Try to get related_questions which often have question/snippet format
+        if 'related_questions' in data:
+            results = data['related_questions'][:limit]
+        # Try organic_results as fallback
+        elif 'organic_results' in data:
+            organic = data['organic_results'][:limit]
+            # Transform organic results to question/snippet format
+            results = [
+                {
+                    'question': item.get('title', ''),
+                    'snippet': item.get('snippet', '')
                 }
-                
-        except httpx.HTTPStatusError as e:
-            return self._handle_error(e, "HTTP error")
-        except httpx.RequestError as e:
-            return self._handle_error(e, "Request error")
-        except Exception as e:
-            return self._handle_error(e, "Unexpected error")
+                for item in organic
+            ]
+        # Use the raw data if it already has the expected format
+        else:
+            # Assume the data might be in the format you described
+            results = data if isinstance(data, list) else []
+        
+        # Generate comprehensive response
+        comprehensive_response = self._combine_results(results)
+        
+        result_data = {
+            "query": query,
+            "results_count": len(results),
+            "comprehensive_response": comprehensive_response,
+            "raw_results": results
+        }
+        if settings.env == "development":
+            # Include full API response for debugging
+            result_data["full_data"] = data
+        
+        return result_data
     
     async def fetch_news(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -149,6 +232,19 @@ class SerpAPIService:
         if params.get("country"):
             query = f"{query} {params['country']}" if query else params['country']
         
+        # Avoid a billed SerpAPI round-trip for an empty query
+        query = (query or "").strip()
+        if not query:
+            return {
+                "success": False,
+                "status_code": 422,
+                "error": {
+                    "message": "Empty query",
+                    "details": "A query, category or country is required"
+                },
+                "timestamp": utcnow_iso()
+            }
+        
         return await self.search(query, limit)
     
     async def fetch_headlines(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -170,87 +266,26 @@ class SerpAPIService:
         limit = params.get("limit", 5)
         return await self.search(query, limit)
     
-    async def search_by_topic(self, topic: str, options: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Search news by topic.
-        
-        Args:
-            topic: Topic to search for
-            options: Additional query options
-            
-        Returns:
-            Dictionary containing success status and comprehensive response
-        """
-        try:
-            params = {
-                "query": topic,
-                **options
-            }
-            return await self.fetch_news(params)
-            
-        except Exception as e:
-            return self._handle_error(e, "Search error")
-    
-    async def health_check(self) -> Dict[str, Any]:
+    async def deep_health_check(self) -> Dict[str, Any]:
         """
-        Check health of SerpAPI service.
+        Check health of SerpAPI service by running a test search.
+        The status is cached for HEALTH_CACHE_TTL seconds so frequent
+        probes do not hit SerpAPI on every call.
         
         Returns:
             Dictionary containing health status
         """
+        if self._health_cache is not None:
+            checked_at, status = self._health_cache
+            if time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+                return dict(status)
+        
         try:
-            # Simple test search
-            result = await self.search("test", limit=1)
-            return {
-                "success": True,
-                "status": "healthy",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            # Uncached test search so HEALTH_CACHE_TTL is the only memoization
+            result = await self._search("test", 1)
+            status = self._health_status(None if result.get("success") else result.get("error"))
         except Exception as e:
-            return {
-                "success": False,
-                "status": "unhealthy",
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-    
-    def _handle_error(self, error: Exception, error_type: str) -> Dict[str, Any]:
-        """
-        Handle and format errors.
+            status = self._health_status(str(e))
         
-        Args:
-            error: Exception that occurred
-            error_type: Type of error
-            
-        Returns:
-            Dictionary containing error information
-        """
-        if isinstance(error, httpx.HTTPStatusError):
-            return {
-                "success": False,
-                "error": {
-                    "message": f"API request failed: {error_type}",
-                    "status": error.response.status_code,
-                    "details": str(error)
-                }
-            }
-        elif isinstance(error, httpx.RequestError):
-            return {
-                "success": False,
-                "error": {
-                    "message": "No response from SerpAPI",
-                    "details": "The request was made but no response was received"
-                }
-            }
-        else:
-            return {
-                "success": False,
-                "error": {
-                    "message": f"Failed to fetch data: {error_type}",
-                    "details": str(error)
-                }
-            }
-
-
-# Global service instance
-serpapi_service = SerpAPIService()
\ No newline at end of file
+        self._health_cache = (time.monotonic(), status)
+        return dict(status)
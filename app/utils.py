@@ -0,0 +1,6 @@
+from datetime import datetime, timezone
+
+
+def utcnow_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
@@ -3,14 +3,19 @@
 Main entry point for the News Agent application.
 This script starts the Uvicorn server with the FastAPI application.
 """
+import sys
 import uvicorn
 from app.config import settings
 
 if __name__ == "__main__":
+    development = settings.env == "development"
     uvicorn.run(
         "app.main:app",
         host=settings.host,
         port=settings.port,
-        reload=(settings.env == "development"),
+        reload=development,
+        workers=None if development else settings.workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_level=settings.log_level.lower()
     )
\ No newline at end of file
@@ -0,0 +1,94 @@
+import asyncio
+import types
+
+from app.services.serpapi_service import SerpAPIService
+
+
+def _make_service(release: asyncio.Event, calls: list) -> SerpAPIService:
+    """Build a service whose upstream search blocks until release is set."""
+    service = SerpAPIService()
+    
+    async def fake_search(query, limit):
+        calls.append((query, limit))
+        await release.wait()
+        return {
+            "success": True,
+            "data": {"query": query, "results_count": 0, "raw_results": []},
+            "timestamp": "2026-01-01T00:00:00.000+00:00"
+        }
+    
+    service._search = fake_search
+    return service
+
+
+def test_concurrent_searches_share_one_upstream_call():
+    async def scenario():
+        calls = []
+        release = asyncio.Event()
+        service = _make_service(release, calls)
+        
+        tasks = [asyncio.create_task(service.search("apple", 3)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        
+        assert len(calls) == 1
+        assert all(result["success"] for result in results)
+        assert len({id(result) for result in results}) == len(results)
+    
+    asyncio.run(scenario())
+
+
+def test_cancelled_first_caller_does_not_fail_waiters():
+    async def scenario():
+        calls = []
+        release = asyncio.Event()
+        service = _make_service(release, calls)
+        
+        first = asyncio.create_task(service.search("apple", 3))
+        second = asyncio.create_task(service.search("Apple", 3))
+        await asyncio.sleep(0)
+        
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        result = await second
+        
+        assert first.cancelled()
+        assert len(calls) == 1
+        assert result["success"]
+        assert result["data"]["query"] == "Apple"
+        # The shared search still completed and populated the cache
+        assert ("apple", 3) in service._cache
+        assert not service._inflight
+    
+    asyncio.run(scenario())
+
+
+def test_deep_health_check_reprobes_after_health_ttl(monkeypatch):
+    from app.services import serpapi_service as module
+    
+    now = [1000.0]
+    monkeypatch.setattr(module, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    
+    responses = [
+        {"success": True, "data": {"query": "test"}, "timestamp": "2026-01-01T00:00:00.000+00:00"},
+        {"success": False, "error": {"message": "API request failed: HTTP error", "status": 500}},
+    ]
+    service = SerpAPIService()
+    
+    async def fake_search(query, limit):
+        return responses.pop(0)
+    
+    service._search = fake_search
+    
+    async def scenario():
+        assert (await service.deep_health_check())["status"] == "healthy"
+        now[0] += module.HEALTH_CACHE_TTL + 1
+        status = await service.deep_health_check()
+        assert status["status"] == "unhealthy"
+        assert not responses
+        # The probe does not populate the user-facing search cache
+        assert not service._cache
+    
+    asyncio.run(scenario())